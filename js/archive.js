@@ -43,19 +43,26 @@ https://github.com/kitian616/jekyll-TeXt-theme
     var $result = $('.js-result');
     var $sections = $result.find('section');
     var sectionArticles = []
+    var sectionArticleTags = [];
     var $lastFocusButton = null;
     var sectionTopArticleIndex = [];
     var hasInit = false;
 
     $sections.each(function() {
-      sectionArticles.push($(this).find('.item'));
+      var $articles = $(this).find('.item'), articleTags = [];
+      // split every article's tags once, not on each tag selection
+      $articles.each(function() {
+        articleTags.push(String($(this).data('tags')).split(','));
+      });
+      sectionArticles.push($articles);
+      sectionArticleTags.push(articleTags);
     });
 
     function init() {
       var i, index = 0;
       for (i = 0; i < $sections.length; i++) {
         sectionTopArticleIndex.push(index);
-        index += $sections.eq(i).find('.item').length;
+        index += sectionArticles[i].length;
       }
       sectionTopArticleIndex.push(index);
     }
@@ -90,7 +97,7 @@ https://github.com/kitian616/jekyll-TeXt-theme
             result[i] || (result[i] = {});
             result[i][j] = true;
           } else {
-            var tags = $articles.eq(j).data('tags').split(',');
+            var tags = sectionArticleTags[i][j];
             for (k = 0; k < tags.length; k++) {
               if (tags[k] === tag) {
                 result[i] || (result[i] = {});
@@ -29,16 +29,14 @@
 
 // responsive tables
 $(document).ready(function() {
-    $("table").wrap("<div class='table-responsive'></div>");
-    $("table").addClass("table");
+    $("table").wrap("<div class='table-responsive'></div>").addClass("table");
 });
 
 // responsive embed videos
 $(document).ready(function() {
-    $('iframe[src*="youtube.com"]').wrap('<div class="embed-responsive embed-responsive-16by9"></div>');
-    $('iframe[src*="youtube.com"]').addClass('embed-responsive-item');
-    $('iframe[src*="vimeo.com"]').wrap('<div class="embed-responsive embed-responsive-16by9"></div>');
-    $('iframe[src*="vimeo.com"]').addClass('embed-responsive-item');
+    $('iframe[src*="youtube.com"], iframe[src*="vimeo.com"]')
+        .wrap('<div class="embed-responsive embed-responsive-16by9"></div>')
+        .addClass('embed-responsive-item');
 });
 
 // Navigation Scripts to Show Header on Scroll-Up
@@ -47,27 +45,29 @@ jQuery(document).ready(function($) {
 
     //primary navigation slide-in effect
     if ($(window).width() > MQL) {
-        var headerHeight = $('.navbar-custom').height(),
+        // query once: the scroll handler below fires on every scroll event
+        var $navbar = $('.navbar-custom'),
+            $catalog = $('.side-catalog'),
+            headerHeight = $navbar.height(),
             bannerHeight  = $('.intro-header .container').height();     
         $(window).on('scroll', {
                 previousTop: 0
             },
             function() {
-                var currentTop = $(window).scrollTop(),
-                    $catalog = $('.side-catalog');
+                var currentTop = $(window).scrollTop();
 
                 //check if user is scrolling up by mouse or keyborad
                 if (currentTop < this.previousTop) {
                     //if scrolling up...
-                    if (currentTop > 0 && $('.navbar-custom').hasClass('is-fixed')) {
-                        $('.navbar-custom').addClass('is-visible');
+                    if (currentTop > 0 && $navbar.hasClass('is-fixed')) {
+                        $navbar.addClass('is-visible');
                     } else {
-                        $('.navbar-custom').removeClass('is-visible is-fixed');
+                        $navbar.removeClass('is-visible is-fixed');
                     }
                 } else {
                     //if scrolling down...
-                    $('.navbar-custom').removeClass('is-visible');
-                    if (currentTop > headerHeight && !$('.navbar-custom').hasClass('is-fixed')) $('.navbar-custom').addClass('is-fixed');
+                    $navbar.removeClass('is-visible');
+                    if (currentTop > headerHeight && !$navbar.hasClass('is-fixed')) $navbar.addClass('is-fixed');
                 }
                 this.previousTop = currentTop;
 
@@ -16,7 +16,9 @@
     }
     // Colors
     if (opts.color) {
-      colorIncr = colorIncrement (opts.color, range);
+      // parse the start color once, not per channel and per tag
+      var colorStart = toRGB(opts.color.start);
+      colorIncr = colorIncrement (colorStart, opts.color.end, range);
     }
     return this.each(function() {
       weighting = $(this).attr("rel") - lowest;
@@ -25,7 +27,7 @@
       }
       if (opts.color) {
         // change color to background-color
-        $(this).css({"backgroundColor": tagColor(opts.color, colorIncr, weighting)});
+        $(this).css({"backgroundColor": tagColor(colorStart, colorIncr, weighting)});
       }
     });
   };
@@ -52,14 +54,14 @@
     }).join("");
   }
 
-  function colorIncrement (color, range) {
-    return jQuery.map(toRGB(color.end), function(n, i) {
-      return (n - toRGB(color.start)[i])/range;
+  function colorIncrement (startRGB, end, range) {
+    return jQuery.map(toRGB(end), function(n, i) {
+      return (n - startRGB[i])/range;
     });
   }
 
-  function tagColor (color, increment, weighting) {
-    rgb = jQuery.map(toRGB(color.start), function(n, i) {
+  function tagColor (startRGB, increment, weighting) {
+    rgb = jQuery.map(startRGB, function(n, i) {
       ref = Math.round(n + (increment[i] * weighting));
       if (ref > 255) {
         ref = 255;